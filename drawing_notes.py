@@ -5,16 +5,94 @@ import requests
 from datetime import datetime, timezone
 from pathlib import Path
 import base64
+import hashlib
+import io
+from PIL import Image
+
+# ---------- Static assets ----------
+# Streamlit serves ./static under app/static when server.enableStaticServing is on
+STATIC_DIR = Path(__file__).parent / "static"
+STATIC_URL = "app/static"
+LOGO_WIDTH = 200
+FAVICON_SIZE = 64
+
+def minify_css(css: str) -> str:
+    """Quita comentarios y espacios sobrantes de un bloque <style>."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+def strip_indent(html: str) -> str:
+    """Elimina la indentación y las líneas vacías de una plantilla HTML/JS."""
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+def optimize_png(data: bytes, max_width: int) -> bytes:
+    """Reescala la imagen a max_width (si es más ancha) y la recomprime."""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            if img.width > max_width:
+                height = round(img.height * max_width / img.width)
+                img = img.resize((max_width, height), Image.LANCZOS)
+            out = io.BytesIO()
+            img.save(out, format="PNG", optimize=True)
+    except Exception:
+        return data
+    optimized = out.getvalue()
+    return optimized if len(optimized) < len(data) else data
+
+@st.cache_resource(show_spinner=False)
+def get_favicon(image_path: str, size: int):
+    """
+    Carga el favicon una sola vez por proceso, reducido a size px.
+    Devuelve una imagen PIL, o la ruta original si no se puede abrir.
+    """
+    try:
+        data = optimize_png(Path(image_path).read_bytes(), size)
+        with Image.open(io.BytesIO(data)) as img:
+            img.load()
+            return img.copy()
+    except Exception:
+        return image_path
+
+@st.cache_resource(show_spinner=False)
+def get_static_image_url(image_path: str, max_width: int):
+    """
+    Carga y optimiza una imagen una sola vez por proceso y la publica en
+    ./static. La URL lleva el hash del contenido como ?v=<hash>, con lo que
+    Streamlit la sirve con caché de larga duración.
+    Devuelve un data URI si el static serving está desactivado o no se puede
+    escribir, o None si la imagen no existe.
+    """
+    source = Path(image_path)
+    try:
+        data = optimize_png(source.read_bytes(), max_width)
+    except OSError:
+        return None
+
+    data_uri = f"data:image/png;base64,{base64.b64encode(data).decode()}"
+    if not st.get_option("server.enableStaticServing"):
+        return data_uri
+
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    target = STATIC_DIR / source.name
+    try:
+        STATIC_DIR.mkdir(exist_ok=True)
+        if not target.exists() or target.read_bytes() != data:
+            target.write_bytes(data)
+    except OSError:
+        return data_uri
+    return f"{STATIC_URL}/{target.name}?v={digest}"
 
 # Page configuration with custom favicon
 st.set_page_config(
     page_title="Drawing Notes Generator", 
-    page_icon="logoSimpleVerde.png",
+    page_icon=get_favicon("logoSimpleVerde.png", FAVICON_SIZE),
     layout="wide"
 )
 
 # Custom CSS
-st.markdown("""
+APP_CSS = """
 <style>
 /* Force checkbox color when checked */
 input[type="checkbox"] {
@@ -106,7 +184,14 @@ hr {
     opacity: 0.8;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource(show_spinner=False)
+def get_app_css() -> str:
+    """CSS de la app minificado una sola vez por proceso."""
+    return minify_css(APP_CSS)
+
+st.markdown(get_app_css(), unsafe_allow_html=True)
 
 # Notion API configuration
 NOTION_TOKEN = st.secrets.get("NOTION_TOKEN", "")
@@ -287,15 +372,6 @@ def add_to_notion(name, email, num_notes, note_types, has_specify):
             has_specify=has_specify,
         )
 
-# Function to convert image to base64
-def get_image_base64(image_path):
-    """Convert image to base64 string"""
-    try:
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
-    except:
-        return None
-
 # Header with title and logo
 header_col1, header_col2 = st.columns([2, 1])
 
@@ -303,17 +379,16 @@ with header_col1:
     st.title("📐 Drawing Notes Generator")
 
 with header_col2:
-    # Try to load and encode logo
-    logo_base64 = get_image_base64("logoVerde.png")
-
-    if logo_base64:
-        logo_html = f"""
-        <div class="logo-container">
-            <a href="https://www.atlantisprototyping.com" target="_blank" class="logo-link">
-                <img src="data:image/png;base64,{logo_base64}" width="200" alt="Atlantis Prototyping">
-            </a>
-        </div>
-        """
+    # Logo optimized and published once per process
+    logo_url = get_static_image_url("logoVerde.png", LOGO_WIDTH * 2)
+
+    if logo_url:
+        logo_html = (
+            '<div class="logo-container">'
+            '<a href="https://www.atlantisprototyping.com" target="_blank" class="logo-link">'
+            f'<img src="{logo_url}" width="{LOGO_WIDTH}" alt="Atlantis Prototyping">'
+            '</a></div>'
+        )
         st.markdown(logo_html, unsafe_allow_html=True)
     else:
         # Fallback if image can't be loaded
@@ -351,6 +426,197 @@ if 'selected_indices' not in st.session_state:
 if 'clear_trigger' not in st.session_state:
     st.session_state.clear_trigger = 0
 
+# ---------- Notes component templates ----------
+NOTES_COMPONENT_CSS = """
+<style>
+.textarea-container {
+    width: 100%;
+    max-width: 100%;
+    box-sizing: border-box;
+}
+
+#textToCopy {
+    overflow-y: scroll !important;
+    box-sizing: border-box !important;
+    scrollbar-width: thin !important;
+    scrollbar-color: #1BA099 #001F33 !important;
+}
+
+#textToCopy::-webkit-scrollbar {
+    width: 16px !important;
+    background: #001F33 !important;
+}
+
+#textToCopy::-webkit-scrollbar-track {
+    background: #001F33 !important;
+    border-left: 2px solid #006DAA !important;
+}
+
+#textToCopy::-webkit-scrollbar-thumb {
+    background: #1BA099 !important;
+    border: 3px solid #001F33 !important;
+    border-radius: 8px !important;
+    min-height: 40px !important;
+}
+
+#textToCopy::-webkit-scrollbar-thumb:hover {
+    background: #25D5CA !important;
+}
+
+#textToCopy::-webkit-scrollbar-thumb:active {
+    background: #158a82 !important;
+}
+</style>
+"""
+
+NOTES_TEXTAREA_STYLE = """
+width: calc(100% - 4px);
+height: 500px; 
+padding: 12px;
+margin: 0;
+font-family: 'Courier New', monospace; 
+font-size: 13px; 
+line-height: 1.5;
+background-color: #003559;
+color: #FFFFFF;
+border: 2px solid #006DAA;
+border-radius: 5px;
+box-shadow: 0 0 10px rgba(0, 109, 170, 0.3);
+resize: vertical;
+overflow-y: scroll;
+box-sizing: border-box;
+"""
+
+NOTES_EMPTY_TEXTAREA_STYLE = "text-align: center; padding-top: 230px; font-size: 16px;"
+
+NOTES_WARNING_HTML = """
+<div style="
+    background-color: #FFA50080;
+    border-left: 4px solid #FF8C00;
+    padding: 12px 15px;
+    margin-bottom: 10px;
+    border-radius: 4px;
+    display: flex;
+    align-items: center;
+    gap: 10px;
+">
+    <span style="font-size: 20px;">⚠️</span>
+    <div>
+        <strong style="color: #FF8C00; font-size: 15px;">Action Required</strong>
+        <p style="margin: 5px 0 0 0; font-size: 14px; color: #333;">
+            Some notes contain <strong>[specify]</strong> placeholders. 
+            Please edit these fields according to your requirements before using.
+        </p>
+    </div>
+</div>
+"""
+
+NOTES_BUTTONS_HTML = """
+<div style="margin-top: 10px; display: flex; gap: 10px; align-items: center;">
+    <button onclick="copyToClipboard()" style="
+        background-color: #1BA099; 
+        color: white; 
+        padding: 10px 20px; 
+        border: none; 
+        border-radius: 5px; 
+        cursor: pointer; 
+        font-size: 15px; 
+        font-weight: 500;
+        transition: background-color 0.3s;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+    ">
+        📋 Copy to Clipboard
+    </button>
+    <span id="copyMessage" style="
+        color: #1BA099; 
+        font-weight: 600;
+        font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
+        font-size: 14px;
+    "></span>
+</div>
+"""
+
+NOTES_COMPONENT_JS = """
+<script>
+// Force scrollbar visibility
+window.addEventListener('load', function() {
+    const textarea = document.getElementById('textToCopy');
+    textarea.style.display = 'none';
+    textarea.offsetHeight;
+    textarea.style.display = 'block';
+});
+
+const buttons = document.querySelectorAll('button');
+
+if (buttons.length > 0) {
+    buttons[0].addEventListener('mouseenter', function() {
+        this.style.backgroundColor = '#158a82';
+    });
+    buttons[0].addEventListener('mouseleave', function() {
+        this.style.backgroundColor = '#1BA099';
+    });
+}
+
+function copyToClipboard() {
+    const text = document.getElementById('textToCopy').value;
+
+    if (navigator.clipboard && window.isSecureContext) {
+        navigator.clipboard.writeText(text).then(function() {
+            document.getElementById('copyMessage').textContent = '✅ Copied!';
+            setTimeout(function() {
+                document.getElementById('copyMessage').textContent = '';
+            }, 2000);
+        }, function(err) {
+            document.getElementById('copyMessage').textContent = '❌ Copy failed';
+        });
+    } else {
+        const textArea = document.getElementById('textToCopy');
+        textArea.select();
+        try {
+            document.execCommand('copy');
+            document.getElementById('copyMessage').textContent = '✅ Copied!';
+            setTimeout(function() {
+                document.getElementById('copyMessage').textContent = '';
+            }, 2000);
+        } catch (err) {
+            document.getElementById('copyMessage').textContent = '❌ Copy failed';
+        }
+    }
+}
+</script>
+"""
+
+@st.cache_resource(show_spinner=False)
+def get_notes_component_template(show_buttons: bool, has_specify: bool) -> tuple:
+    """
+    Pre-renderiza una sola vez por proceso el HTML/CSS/JS del componente de
+    notas. Devuelve (head, tail): en cada rerun solo se inserta el texto entre
+    ambos.
+    """
+    textarea_style = NOTES_TEXTAREA_STYLE
+    if not show_buttons:
+        textarea_style += NOTES_EMPTY_TEXTAREA_STYLE
+
+    button_section = ""
+    if show_buttons:
+        warning_html = NOTES_WARNING_HTML if has_specify else ""
+        button_section = warning_html + NOTES_BUTTONS_HTML
+
+    head = (
+        minify_css(NOTES_COMPONENT_CSS)
+        + '<div class="textarea-container">'
+        + f'<textarea id="textToCopy" style="{minify_css(textarea_style)}"'
+        + ("" if show_buttons else " readonly")
+        + ">"
+    )
+    tail = (
+        "</textarea>"
+        + strip_indent(button_section)
+        + "</div>"
+        + strip_indent(NOTES_COMPONENT_JS)
+    )
+    return head, tail
+
 # Two main columns
 col_left, col_right = st.columns([1, 1.5])
 
@@ -432,172 +698,12 @@ with col_right:
         show_buttons = False
         has_specify_fields = False
 
-    # Warning message if there are [specify] fields
-    warning_html = ""
-    if show_buttons and has_specify_fields:
-        warning_html = """
-            <div style="
-                background-color: #FFA50080;
-                border-left: 4px solid #FF8C00;
-                padding: 12px 15px;
-                margin-bottom: 10px;
-                border-radius: 4px;
-                display: flex;
-                align-items: center;
-                gap: 10px;
-            ">
-                <span style="font-size: 20px;">⚠️</span>
-                <div>
-                    <strong style="color: #FF8C00; font-size: 15px;">Action Required</strong>
-                    <p style="margin: 5px 0 0 0; font-size: 14px; color: #333;">
-                        Some notes contain <strong>[specify]</strong> placeholders. 
-                        Please edit these fields according to your requirements before using.
-                    </p>
-                </div>
-            </div>
-        """
-
-    button_section = ""
-    if show_buttons:
-        button_section = f"""
-            {warning_html}
-            <div style="margin-top: 10px; display: flex; gap: 10px; align-items: center;">
-                <button onclick="copyToClipboard()" style="
-                    background-color: #1BA099; 
-                    color: white; 
-                    padding: 10px 20px; 
-                    border: none; 
-                    border-radius: 5px; 
-                    cursor: pointer; 
-                    font-size: 15px; 
-                    font-weight: 500;
-                    transition: background-color 0.3s;
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                ">
-                    📋 Copy to Clipboard
-                </button>
-                <span id="copyMessage" style="
-                    color: #1BA099; 
-                    font-weight: 600;
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
-                    font-size: 14px;
-                "></span>
-            </div>
-        """
-
-    # Textarea with scrollbar
+    # Textarea with scrollbar; only the notes text changes between reruns
+    component_head, component_tail = get_notes_component_template(
+        show_buttons, show_buttons and has_specify_fields
+    )
     st.components.v1.html(
-        f"""
-        <style>
-        .textarea-container {{
-            width: 100%;
-            max-width: 100%;
-            box-sizing: border-box;
-        }}
-
-        #textToCopy {{
-            overflow-y: scroll !important;
-            box-sizing: border-box !important;
-            scrollbar-width: thin !important;
-            scrollbar-color: #1BA099 #001F33 !important;
-        }}
-
-        #textToCopy::-webkit-scrollbar {{
-            width: 16px !important;
-            background: #001F33 !important;
-        }}
-
-        #textToCopy::-webkit-scrollbar-track {{
-            background: #001F33 !important;
-            border-left: 2px solid #006DAA !important;
-        }}
-
-        #textToCopy::-webkit-scrollbar-thumb {{
-            background: #1BA099 !important;
-            border: 3px solid #001F33 !important;
-            border-radius: 8px !important;
-            min-height: 40px !important;
-        }}
-
-        #textToCopy::-webkit-scrollbar-thumb:hover {{
-            background: #25D5CA !important;
-        }}
-
-        #textToCopy::-webkit-scrollbar-thumb:active {{
-            background: #158a82 !important;
-        }}
-        </style>
-
-        <div class="textarea-container">
-            <textarea id="textToCopy" style="
-                width: calc(100% - 4px);
-                height: 500px; 
-                padding: 12px;
-                margin: 0;
-                font-family: 'Courier New', monospace; 
-                font-size: 13px; 
-                line-height: 1.5;
-                background-color: #003559;
-                color: #FFFFFF;
-                border: 2px solid #006DAA;
-                border-radius: 5px;
-                box-shadow: 0 0 10px rgba(0, 109, 170, 0.3);
-                resize: vertical;
-                overflow-y: scroll;
-                box-sizing: border-box;
-                {'text-align: center; padding-top: 230px; font-size: 16px;' if not show_buttons else ''}
-            " {'readonly' if not show_buttons else ''}>{final_text}</textarea>
-            {button_section}
-        </div>
-
-        <script>
-        // Force scrollbar visibility
-        window.addEventListener('load', function() {{
-            const textarea = document.getElementById('textToCopy');
-            textarea.style.display = 'none';
-            textarea.offsetHeight;
-            textarea.style.display = 'block';
-        }});
-
-        const buttons = document.querySelectorAll('button');
-
-        if (buttons.length > 0) {{
-            buttons[0].addEventListener('mouseenter', function() {{
-                this.style.backgroundColor = '#158a82';
-            }});
-            buttons[0].addEventListener('mouseleave', function() {{
-                this.style.backgroundColor = '#1BA099';
-            }});
-        }}
-
-        function copyToClipboard() {{
-            const text = document.getElementById('textToCopy').value;
-
-            if (navigator.clipboard && window.isSecureContext) {{
-                navigator.clipboard.writeText(text).then(function() {{
-                    document.getElementById('copyMessage').textContent = '✅ Copied!';
-                    setTimeout(function() {{
-                        document.getElementById('copyMessage').textContent = '';
-                    }}, 2000);
-                }}, function(err) {{
-                    document.getElementById('copyMessage').textContent = '❌ Copy failed';
-                }});
-            }} else {{
-                const textArea = document.getElementById('textToCopy');
-                textArea.select();
-                try {{
-                    document.execCommand('copy');
-                    document.getElementById('copyMessage').textContent = '✅ Copied!';
-                    setTimeout(function() {{
-                        document.getElementById('copyMessage').textContent = '';
-                    }}, 2000);
-                }} catch (err) {{
-                    document.getElementById('copyMessage').textContent = '❌ Copy failed';
-                }}
-            }}
-        }}
-        </script>
-        """,
+        component_head + final_text + component_tail,
         height=640
     )
 